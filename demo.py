@@ -20,14 +20,15 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import asyncio
+import gc
 from json import load
-from time import localtime, sleep_ms, time
+from time import localtime, time
 
 from machine import I2C, RTC, Pin
 from network import WLAN
 
 from lcd1602 import LCD1602
-from ntp import Client
 from sht31 import SHT31
 
 with open('settings.json', 'r') as f:
@@ -43,13 +44,25 @@ use_celcius: bool = settings['sht31'].get('unit', 'F') == 'C'
 loops: int = settings['app'].get('loops', 100)
 delay: int = settings['app'].get('delay', 5000)
 
+# Display line templates.
+date_format = 'D: {:04}/{:02}/{:02}'
+time_format = 'T: {:02}:{:02}:{:02}'
+temp_format = 'T: {:5.1f}' + ('C' if use_celcius else 'F')
+humidity_format = 'H: {:5.1f}%'
+
 
 blue = Pin(15, Pin.OUT)
 green = Pin(14, Pin.OUT)
 i2c0 = I2C(0, scl=Pin(17), sda=Pin(16), freq=100_000)
 wlan = WLAN()
 rtc = RTC()
+client = None
 ntp_time = 0
+retry_delays = (5, 10, 20, 40, 80, 160, 320, 600)
+retry_index = 0
+retry_time = 0
+lcd_lock = asyncio.Lock()
+time_ready = asyncio.Event()
 sht31 = SHT31(i2c0, use_celcius=use_celcius)
 lcd1602 = LCD1602(i2c0)
 
@@ -59,80 +72,112 @@ def setup():
     blue.off()
     green.off()
     wlan.active(True)
+    gc.threshold(gc.mem_free() // 4 + gc.mem_alloc())
     lcd1602.display_control(display_on=True, cursor_on=False, blink_on=False)
     lcd1602.clear_display()
 
 
-def connect_to_wifi():
+async def show_status(line0: str, line1: str = ''):
+    """Shows a status message, holding the display only while writing it.
+
+    :param line0: The first row.
+    :type line0: str
+    :param line1: The second row, defaults to empty.
+    :type line1: str, optional
+    """
+    async with lcd_lock:
+        lcd1602.write_frame(line0, line1)
+
+
+async def connect_to_wifi():
     """Connects to the configured Wi-Fi."""
-    lcd1602.clear_display()
-    lcd1602.return_home()
-    lcd1602.write('Connecting...')
+    await show_status('Connecting...')
     wlan.connect(ssid, key)
     while not wlan.isconnected():
-        sleep_ms(100)
-    lcd1602.clear_display()
-    lcd1602.return_home()
-    lcd1602.write('Connected')
-    sleep_ms(1000)
-    lcd1602.clear_display()
-    lcd1602.return_home()
+        await asyncio.sleep_ms(100)
+    await show_status('Connected')
+    await asyncio.sleep_ms(1000)
 
 
-def update_time():
-    """Updates the time from the configured NTP server."""
-    lcd1602.clear_display()
-    lcd1602.return_home()
-    lcd1602.write('Getting time...')
-    client = Client(host=host, port=port)
+async def update_time():
+    """Updates the time from the configured NTP server.
+
+    Failed attempts are retried after an increasing delay (see `retry_delays`), which resets on success.
+    """
+    global client, ntp_time, retry_index, retry_time
+    await show_status('Getting time...')
     try:
-        global ntp_time
-        ntp_time = client.query_time() + offset * 3600
-        lcd1602.clear_display()
-        lcd1602.return_home()
-        lcd1602.write('Got time')
+        if client is None:
+            # The NTP client is imported on first use, after a collection to free up contiguous heap.
+            gc.collect()
+            from ntp import Client
+
+            client = Client(host=host, port=port)
+        ntp_time = await client.query_time_fast_async() + offset * 3600
+        retry_index = 0
+        retry_time = 0
         dt = localtime(ntp_time)
         rtc.datetime((dt[0], dt[1], dt[2], dt[6], dt[3], dt[4], dt[5], dt[7]))
+        await show_status('Got time')
     except Exception as e:
-        lcd1602.clear_display()
-        lcd1602.return_home()
-        lcd1602.write('No time')
-        lcd1602.move_cursor(0, 1)
+        retry_time = time() + retry_delays[min(retry_index, len(retry_delays) - 1)]
+        retry_index += 1
         if isinstance(e, OSError):
-            lcd1602.write('Timeout')
+            await show_status('No time', 'Timeout')
+        elif isinstance(e, ValueError):
+            await show_status('No time', 'Bad data')
         else:
-            lcd1602.write('Bad data')
-    sleep_ms(1000)
-    lcd1602.clear_display()
-    lcd1602.return_home()
+            await show_status('No time', type(e).__name__)
+    await asyncio.sleep_ms(1000)
+
+
+async def keep_time():
+    """Keeps the Wi-Fi connected and the `RTC` synchronized with the configured NTP server.
+
+    Errors are shown on the display and the task keeps running, trying again after `delay` milliseconds.
+    """
+    while True:
+        try:
+            if not wlan.isconnected():
+                await connect_to_wifi()
+            now = time()
+            if (ntp_time == 0 or now - ntp_time > interval) and now >= retry_time:
+                await update_time()
+        except Exception as e:
+            time_ready.set()
+            await show_status('Error', type(e).__name__)
+            await asyncio.sleep_ms(delay)
+            continue
+        time_ready.set()
+        if retry_time != 0:
+            # Wake up in time for the next retry, independently of the display cadence.
+            await asyncio.sleep_ms(min(delay, max(0, retry_time - time()) * 1000))
+        else:
+            await asyncio.sleep_ms(delay)
 
 
-def run():
+async def run():
     """Runs the application."""
     green.on()
+    time_task = asyncio.create_task(keep_time())
+    # Let the initial connect and time update finish before showing the date and time.
+    await time_ready.wait()
     show_dt = True
     for _ in range(loops):
-        if not wlan.isconnected():
-            connect_to_wifi()
-        if ntp_time == 0 or time() - ntp_time > interval:
-            update_time()
-        lcd1602.clear_display()
-        lcd1602.return_home()
-        if show_dt is True:
-            dt = rtc.datetime()
-            lcd1602.write(f'D: {dt[0]:04}/{dt[1]:02}/{dt[2]:02}')
-            lcd1602.move_cursor(0, 1)
-            lcd1602.write(f'T: {dt[4]:02}:{dt[5]:02}:{dt[6]:02}')
-        else:
-            unit = 'C' if use_celcius else 'F'
-            temp, humidity = sht31.take_measurement()
-            lcd1602.write(f'T: {temp:.1f}{unit}')
-            lcd1602.move_cursor(0, 1)
-            lcd1602.write(f'H: {humidity:.1f}%')
+        async with lcd_lock:
+            # Frames are padded to the full display width, overwriting the previous frame without a clear.
+            if show_dt is True:
+                dt = rtc.datetime()
+                lcd1602.write_frame(date_format.format(dt[0], dt[1], dt[2]), time_format.format(dt[4], dt[5], dt[6]))
+            else:
+                temp, humidity = sht31.take_measurement()
+                lcd1602.write_frame(temp_format.format(temp), humidity_format.format(humidity))
         show_dt = not show_dt
         blue.toggle()
         green.toggle()
-        sleep_ms(delay)
+        await asyncio.sleep_ms(delay)
+        gc.collect()
+    time_task.cancel()
 
 
 def teardown():
@@ -141,6 +186,8 @@ def teardown():
     lcd1602.display_control(display_on=False)
     blue.off()
     green.off()
+    if client is not None:
+        client.close()
     wlan.disconnect()
     wlan.active(False)
 
@@ -148,7 +195,7 @@ def teardown():
 def main():
     """Application entry-point."""
     setup()
-    run()
+    asyncio.run(run())
     teardown()
 
 
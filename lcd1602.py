@@ -81,6 +81,18 @@ class LCD1602:
         """
         self.bus = bus
         self.address = address
+        self._one = bytearray(1)
+        # A full frame is a single transfer: for each row, a DDRAM address instruction followed by
+        # 16 characters. Every byte is preceded by a control byte; all but the last have the
+        # continuation bit (`0x80`) set, `0x80` prefixing an instruction and `0xC0` a data byte.
+        self._frame = bytearray(68)
+        for row in range(2):
+            base = row * 34
+            self._frame[base] = 0x80
+            self._frame[base + 1] = INSTR_SET_DDRAM_ADDRESS | (row * 0x40)
+            for col in range(16):
+                self._frame[base + 2 + col * 2] = 0xC0
+        self._frame[66] = 0x40
         for _ in range(4):
             self.function_set()
             sleep_ms(5)
@@ -95,7 +107,8 @@ class LCD1602:
         :param instr: The instruction.
         :type instr: int
         """
-        self.bus.writeto_mem(self.address, 0x80, chr(instr))
+        self._one[0] = instr
+        self.bus.writeto_mem(self.address, 0x80, self._one)
 
     def write_to_dr(self, data: int):
         """Write to Data Register (DR).
@@ -105,7 +118,8 @@ class LCD1602:
         :param data: The data.
         :type data: int
         """
-        self.bus.writeto_mem(self.address, 0x40, chr(data))
+        self._one[0] = data
+        self.bus.writeto_mem(self.address, 0x40, self._one)
 
     def clear_display(self):
         """Clears the display."""
@@ -128,15 +142,11 @@ class LCD1602:
         :param shift: Boolean flag indicating whether or not to shift, defaults to False.
         :type shift: bool, optional.
         """
-        instr = INSTR_ENTRY_MODE_SET
-        if increment:
-            instr |= DIR_RIGHT
-        else:
-            instr |= DIR_LEFT
-        if shift:
-            instr |= SHIFT_DIRECTION
-        else:
-            instr |= SHIFT_NONE
+        instr = (
+            INSTR_ENTRY_MODE_SET
+            | (DIR_RIGHT if increment else DIR_LEFT)
+            | (SHIFT_DIRECTION if shift else SHIFT_NONE)
+        )
         self.write_to_ir(instr)
 
     def display_control(self, display_on=True, cursor_on=True, blink_on=True):
@@ -149,19 +159,12 @@ class LCD1602:
         :param blink_on: Boolean flag indicating whether or not the cursor (if on) should blink, defaults to True.
         :type blink_on: bool, optional.
         """
-        instr = INSTR_DISPLAY_CONTROL
-        if display_on:
-            instr |= DISPLAY_ON
-        else:
-            instr |= DISPLAY_OFF
-        if cursor_on:
-            instr |= CURSOR_ON
-        else:
-            instr |= CURSOR_OFF
-        if blink_on:
-            instr |= BLINK_ON
-        else:
-            instr |= BLINK_OFF
+        instr = (
+            INSTR_DISPLAY_CONTROL
+            | (DISPLAY_ON if display_on else DISPLAY_OFF)
+            | (CURSOR_ON if cursor_on else CURSOR_OFF)
+            | (BLINK_ON if blink_on else BLINK_OFF)
+        )
         self.write_to_ir(instr)
 
     def cursor_or_display_shift(self, move_display: bool = False, move_right: bool = False):
@@ -172,15 +175,11 @@ class LCD1602:
         :param move_right: Boolean flag indicating whether or not to move right, defaults to False.
         :type move_right: bool, optional.
         """
-        cmd = INSTR_CURSOR_OR_DISPLAY_SHIFT
-        if move_display:
-            cmd |= MOVE_DISPLAY
-        else:
-            cmd |= MOVE_CURSOR
-        if move_right:
-            cmd |= MOVE_RIGHT
-        else:
-            cmd |= MOVE_LEFT
+        cmd = (
+            INSTR_CURSOR_OR_DISPLAY_SHIFT
+            | (MOVE_DISPLAY if move_display else MOVE_CURSOR)
+            | (MOVE_RIGHT if move_right else MOVE_LEFT)
+        )
         self.write_to_ir(cmd)
 
     def function_set(self, mode_8bit: bool = False, two_lines: bool = True, mode_11dots: bool = False):
@@ -193,19 +192,12 @@ class LCD1602:
         :param mode_11dots: Boolean flag indicating whether or not to use 11-dot mode, defaults to False.
         :type mode_11dots: bool, optional.
         """
-        instr = INSTR_FUNCTION_SET
-        if mode_8bit:
-            instr |= MODE_8BIT
-        else:
-            instr |= MODE_4BIT
-        if two_lines:
-            instr |= MODE_2LINE
-        else:
-            instr |= MODE_1LINE
-        if mode_11dots:
-            instr |= MODE_11DOTS
-        else:
-            instr |= MODE_8DOTS
+        instr = (
+            INSTR_FUNCTION_SET
+            | (MODE_8BIT if mode_8bit else MODE_4BIT)
+            | (MODE_2LINE if two_lines else MODE_1LINE)
+            | (MODE_11DOTS if mode_11dots else MODE_8DOTS)
+        )
         self.write_to_ir(instr)
 
     def set_cgram_address(self, address: int):
@@ -243,10 +235,31 @@ class LCD1602:
     def write(self, s: str):
         """Writes a string to the display.
 
-        The string will be decoded using `UTF-8`.
+        The string will be encoded using `UTF-8` and sent in a single transfer, relying on
+        the controller auto-incrementing the DDRAM address after each data byte.
 
         :param s: The string.
         :type s: str
         """
-        for x in bytearray(s, "utf-8"):
-            self.write_to_dr(x)
+        self.bus.writeto_mem(self.address, 0x40, s.encode('utf-8'))
+
+    def write_frame(self, line0: str, line1: str):
+        """Writes both rows of the display in a single transfer.
+
+        Each line is encoded using `UTF-8` and the encoded bytes are truncated or padded with spaces to 16
+        bytes, one per display cell; a multi-byte character may therefore be split at the end of a row.
+
+        :param line0: The first row.
+        :type line0: str
+        :param line1: The second row.
+        :type line1: str
+        """
+        frame = self._frame
+        base = 3
+        for line in (line0, line1):
+            data = line.encode('utf-8')
+            n = len(data)
+            for col in range(16):
+                frame[base + col * 2] = data[col] if col < n else 0x20
+            base += 34
+        self.bus.writeto(self.address, frame)
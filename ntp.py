@@ -20,8 +20,28 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import asyncio
+import errno
 import socket
 import struct
+from time import ticks_add, ticks_diff, ticks_ms
+
+_PACKET_FORMAT = '!bbbbIIIQQQQ'
+"""The NTP version 3 packet format."""
+_EPOCH_DELTA = 2208988800
+"""The pre-computed epoch delta, in seconds, between NTP (1/1/1900) and Unix/system (1/1/1970) epochs."""
+_PACKET_SIZE = 48
+"""The NTP version 3 packet size, in bytes."""
+_MAX_RECEIVES = 3
+"""The maximum number of packets received while waiting for the server's response."""
+_POLL_INTERVAL = 50
+"""The interval, in milliseconds, between polls for the response in asynchronous queries."""
+_TIMESTAMP_FORMAT = '!Q'
+"""The NTP timestamp format."""
+_TRANSMIT_TIMESTAMP_OFFSET = 40
+"""The offset of the transmit timestamp in an NTP version 3 packet."""
+_REQUEST_PACKET = struct.pack(_PACKET_FORMAT, (3 << 3) | 3, 0, 0, 0, 0, 0, 0, 0, _EPOCH_DELTA << 32, 0, 0)
+"""The pre-packed request sent by `Client` queries, equivalent to `Client.pack_request()`."""
 
 
 class Client:
@@ -34,11 +54,6 @@ class Client:
     This implementation acts as a client, so `mode` is `3`, with a version number, `vn`,  of `3`.
     """
 
-    _PACKET_FORMAT = '!bbbbIIIQQQQ'
-    """The NTP version 3 packet format."""
-    _EPOCH_DELTA = 2208988800
-    """The pre-computed epoch delta, in seconds, between NTP (1/1/1900) and Unix/system (1/1/1970) epochs."""
-
     def __init__(self, host: str = '0.north-america.pool.ntp.org', port: int = 123, timeout: int = 5):
         """Initializes a new `NTP` instance.
 
@@ -52,6 +67,8 @@ class Client:
         self.host = host
         self.port = port
         self.timeout = timeout
+        self._dest_addr = None
+        self._sock = None
         self.li = 0
         self.vn = 3
         self.mode = 3
@@ -71,24 +88,124 @@ class Client:
 
         The time that is returned is the NTP server's transmit time. This timestamp will be - at least - some milliseconds old.
 
+        The resolved server address is cached across queries and discarded if a query fails.
+
         :raises OSError: If the NTP network request fails or times out.
         :raises ValueError: If the received response data is invalid.
         :return: The current time in seconds since the Unix epoch (1/1/1970).
         :rtype: int
         """
-        dest_addr = socket.getaddrinfo(self.host, self.port, socket.AF_INET)[0][-1]
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.settimeout(self.timeout)
-        data = self.pack_request()
-        s.sendto(data, dest_addr)
-        while True:
-            data, src_addr = s.recvfrom(256)
-            if src_addr == dest_addr:
-                break
-        s.close()
+        data = self._exchange()
         self.unpack_response(data)
         return self.transmit_timestamp
 
+    def query_time_fast(self) -> int:
+        """Queries the configured NTP server for the current time, decoding only the transmit timestamp.
+
+        Unlike `query_time`, no other response fields are unpacked and set on `self`.
+
+        :raises OSError: If the NTP network request fails or times out.
+        :raises ValueError: If the received response data is invalid.
+        :return: The current time in seconds since the Unix epoch (1/1/1970).
+        :rtype: int
+        """
+        data = self._exchange()
+        values = struct.unpack_from(_TIMESTAMP_FORMAT, data, _TRANSMIT_TIMESTAMP_OFFSET)
+        return (values[0] >> 32) - _EPOCH_DELTA
+
+    async def query_time_fast_async(self) -> int:
+        """Queries the configured NTP server for the current time, like `query_time_fast`, without blocking.
+
+        The response is polled for on a non-blocking socket, yielding to other tasks in between. The host
+        name is still resolved with a blocking call, but only on the first query and after a failed one.
+
+        :raises OSError: If the NTP network request fails or times out.
+        :raises ValueError: If the received response data is invalid.
+        :return: The current time in seconds since the Unix epoch (1/1/1970).
+        :rtype: int
+        """
+        data = await self._exchange_async()
+        values = struct.unpack_from(_TIMESTAMP_FORMAT, data, _TRANSMIT_TIMESTAMP_OFFSET)
+        return (values[0] >> 32) - _EPOCH_DELTA
+
+    def _open(self):
+        """Resolves the configured NTP server and creates the socket, unless already done.
+
+        The resolved address and the socket are kept between queries.
+
+        :return: The server address and the socket.
+        :rtype: tuple
+        """
+        if self._dest_addr is None:
+            self._dest_addr = socket.getaddrinfo(self.host, self.port, socket.AF_INET)[0][-1]
+        if self._sock is None:
+            self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        return self._dest_addr, self._sock
+
+    def _exchange(self) -> bytes:
+        """Sends the request to the configured NTP server and receives the response.
+
+        :raises OSError: If the NTP network request fails or times out.
+        :return: The response data.
+        :rtype: bytes
+        """
+        dest_addr, s = self._open()
+        try:
+            s.settimeout(self.timeout)
+            s.sendto(_REQUEST_PACKET, dest_addr)
+            for _ in range(_MAX_RECEIVES):
+                data, src_addr = s.recvfrom(_PACKET_SIZE)
+                if src_addr == dest_addr:
+                    break
+            else:
+                raise OSError(errno.ETIMEDOUT)
+        except OSError:
+            # Resolve the host again and start over with a new socket on the next query.
+            self._dest_addr = None
+            self.close()
+            raise
+        return data
+
+    async def _exchange_async(self) -> bytes:
+        """Sends the request to the configured NTP server and polls for the response.
+
+        :raises OSError: If the NTP network request fails or `timeout` seconds pass without a response.
+        :return: The response data.
+        :rtype: bytes
+        """
+        dest_addr, s = self._open()
+        try:
+            s.settimeout(0)
+            s.sendto(_REQUEST_PACKET, dest_addr)
+            deadline = ticks_add(ticks_ms(), self.timeout * 1000)
+            for _ in range(_MAX_RECEIVES):
+                while True:
+                    try:
+                        data, src_addr = s.recvfrom(_PACKET_SIZE)
+                        break
+                    except OSError as e:
+                        if e.errno not in (errno.EAGAIN, errno.ETIMEDOUT):
+                            raise
+                    if ticks_diff(deadline, ticks_ms()) <= 0:
+                        raise OSError(errno.ETIMEDOUT)
+                    await asyncio.sleep_ms(_POLL_INTERVAL)
+                if src_addr == dest_addr:
+                    break
+            else:
+                raise OSError(errno.ETIMEDOUT)
+        except OSError:
+            # Resolve the host again and start over with a new socket on the next query.
+            self._dest_addr = None
+            self.close()
+            raise
+        return data
+
+    def close(self):
+        """Closes the socket kept open between queries, if any."""
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
     def pack_request(self, origin_timestamp: int = 0):
         """Packs the request.
 
@@ -100,7 +217,7 @@ class Client:
         self.vn = 3
         self.mode = 3
         return struct.pack(
-            Client._PACKET_FORMAT,
+            _PACKET_FORMAT,
             ((self.vn & 0b00000111) << 3 | self.mode & 0b00000111),
             0,
             0,
@@ -109,7 +226,7 @@ class Client:
             0,
             0,
             0,
-            (origin_timestamp + Client._EPOCH_DELTA) << 32,
+            (origin_timestamp + _EPOCH_DELTA) << 32,
             0,
             0,
         )
@@ -123,7 +240,7 @@ class Client:
         :type data: bytes
         :raises ValueError: If the response data is invalid.
         """
-        values = struct.unpack(Client._PACKET_FORMAT, data)
+        values = struct.unpack(_PACKET_FORMAT, data)
         self.li = (values[0] >> 6) & 0b00000011
         self.vn = (values[0] >> 3) & 0b00000111
         self.mode = values[0] & 0b00000111
@@ -139,7 +256,7 @@ class Client:
             self.reference_id = "%d.%d.%d.%d" % fields
         else:
             self.reference_id = 'INVALID'
-        self.reference_timestamp = (values[7] >> 32) - Client._EPOCH_DELTA
-        self.origin_timestamp = (values[8] >> 32) - Client._EPOCH_DELTA
-        self.receive_timestamp = (values[9] >> 32) - Client._EPOCH_DELTA
-        self.transmit_timestamp = (values[10] >> 32) - Client._EPOCH_DELTA
+        self.reference_timestamp = (values[7] >> 32) - _EPOCH_DELTA
+        self.origin_timestamp = (values[8] >> 32) - _EPOCH_DELTA
+        self.receive_timestamp = (values[9] >> 32) - _EPOCH_DELTA
+        self.transmit_timestamp = (values[10] >> 32) - _EPOCH_DELTA
@@ -20,11 +20,48 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-from time import sleep_ms
+import struct
 
+import micropython
 from machine import I2C
 
 
+# The CRC-8 lookup table (polynomial `0x31`, MSB-first), generated with:
+#
+#     for i in range(256):
+#         crc = i
+#         for _ in range(8):
+#             crc = ((crc << 1) & 0xFF) ^ 0x31 if crc & 0x80 else (crc << 1) & 0xFF
+#         table[i] = crc
+#
+# It is kept as a literal so that it is stored in flash when the module is frozen.
+_CRC_TABLE = (
+    b'\x00\x31\x62\x53\xC4\xF5\xA6\x97\xB9\x88\xDB\xEA\x7D\x4C\x1F\x2E'
+    b'\x43\x72\x21\x10\x87\xB6\xE5\xD4\xFA\xCB\x98\xA9\x3E\x0F\x5C\x6D'
+    b'\x86\xB7\xE4\xD5\x42\x73\x20\x11\x3F\x0E\x5D\x6C\xFB\xCA\x99\xA8'
+    b'\xC5\xF4\xA7\x96\x01\x30\x63\x52\x7C\x4D\x1E\x2F\xB8\x89\xDA\xEB'
+    b'\x3D\x0C\x5F\x6E\xF9\xC8\x9B\xAA\x84\xB5\xE6\xD7\x40\x71\x22\x13'
+    b'\x7E\x4F\x1C\x2D\xBA\x8B\xD8\xE9\xC7\xF6\xA5\x94\x03\x32\x61\x50'
+    b'\xBB\x8A\xD9\xE8\x7F\x4E\x1D\x2C\x02\x33\x60\x51\xC6\xF7\xA4\x95'
+    b'\xF8\xC9\x9A\xAB\x3C\x0D\x5E\x6F\x41\x70\x23\x12\x85\xB4\xE7\xD6'
+    b'\x7A\x4B\x18\x29\xBE\x8F\xDC\xED\xC3\xF2\xA1\x90\x07\x36\x65\x54'
+    b'\x39\x08\x5B\x6A\xFD\xCC\x9F\xAE\x80\xB1\xE2\xD3\x44\x75\x26\x17'
+    b'\xFC\xCD\x9E\xAF\x38\x09\x5A\x6B\x45\x74\x27\x16\x81\xB0\xE3\xD2'
+    b'\xBF\x8E\xDD\xEC\x7B\x4A\x19\x28\x06\x37\x64\x55\xC2\xF3\xA0\x91'
+    b'\x47\x76\x25\x14\x83\xB2\xE1\xD0\xFE\xCF\x9C\xAD\x3A\x0B\x58\x69'
+    b'\x04\x35\x66\x57\xC0\xF1\xA2\x93\xBD\x8C\xDF\xEE\x79\x48\x1B\x2A'
+    b'\xC1\xF0\xA3\x92\x05\x34\x67\x56\x78\x49\x1A\x2B\xBC\x8D\xDE\xEF'
+    b'\x82\xB3\xE0\xD1\x46\x77\x24\x15\x3B\x0A\x59\x68\xFF\xCE\x9D\xAC'
+)
+"""The pre-computed CRC-8 lookup table."""
+_CELCIUS_SCALE = 175.0 / 65535.0
+"""The scale from raw temperature to degrees Celcius."""
+_FAHRENHEIT_SCALE = 315.0 / 65535.0
+"""The scale from raw temperature to degrees Fahrenheit."""
+_HUMIDITY_SCALE = 100.0 / 65535.0
+"""The scale from raw humidity to relative humidity, in percent."""
+
+
 class SHT31:
     """Encapsulation of I2C SHT31 device."""
 
@@ -49,37 +86,38 @@ class SHT31:
         :return: The temperature (in Fahrenheit, by default) and relative humidity.
         :rtype: tuple[float, float].
         """
-        buf = bytes([0x2C, 0x06])
-        self.bus.writeto(self.address, buf)
-        sleep_ms(100)
+        # Single shot, high repeatability, clock stretching enabled: the
+        # SHT31 holds SCL low during the read until the data is ready.
+        self.bus.writeto(self.address, b'\x2C\x06')
         buf = self.bus.readfrom(self.address, 6)
-        temp_crc = self.calc_crc(buf[0:2])
-        if temp_crc != buf[2]:
+        raw_temp, temp_crc, raw_humidity, humidity_crc = struct.unpack('>HBHB', buf)
+        mv = memoryview(buf)
+        if self.calc_crc(mv[0:2]) != temp_crc:
             raise ValueError("temp CRC mismatch")
-        humidity_crc = self.calc_crc(buf[3:5])
-        if humidity_crc != buf[5]:
+        if self.calc_crc(mv[3:5]) != humidity_crc:
             raise ValueError("humidity CRC mismatch")
         if self.use_celcius:
-            temp = (((buf[0] << 8) + buf[1]) * 175.0) / 65535.0 - 45.0
+            temp = raw_temp * _CELCIUS_SCALE - 45.0
         else:
-            temp = (((buf[0] << 8) + buf[1]) * 315.0) / 65535.0 - 49.0
-        humidity = (((buf[3] << 8) + buf[4])) * 100.0 / 65535.0
+            temp = raw_temp * _FAHRENHEIT_SCALE - 49.0
+        humidity = raw_humidity * _HUMIDITY_SCALE
         return (temp, humidity)
 
-    def calc_crc(self, buf: bytes) -> int:
+    @micropython.viper
+    def calc_crc(self, buf) -> int:
         """Calculates the CRC.
 
+        Compiled with the viper emitter; `buf` must support the buffer protocol.
+
         :param buf: The buffer,
         :type buf: bytes
         :return: The CRC.
         :rtype: int.
         """
+        table = ptr8(_CRC_TABLE)
+        p = ptr8(buf)
+        n = int(len(buf))
         crc = 0xFF
-        for b in buf:
-            crc = (crc ^ b) & 0xFF
-            for _ in range(8):
-                if crc & 0x80 != 0:
-                    crc = ((crc << 1) & 0xFF) ^ 0x31
-                else:
-                    crc = (crc << 1) & 0xFF
+        for i in range(n):
+            crc = table[crc ^ p[i]]
         return crc